@@ -0,0 +1,23 @@
+"""Lenient JSON parsing for model responses."""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def parse_json_object(raw_text: str) -> Any:
+    """Parse a JSON object, tolerating markdown fences or prose around it.
+
+    Falls back to the span from the first ``{`` to the last ``}``, which
+    covers the usual ```json fenced and "Here is the JSON:" responses.
+    Raises ``orjson.JSONDecodeError`` if that span is not valid JSON either.
+    """
+    try:
+        return orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        start = raw_text.find("{")
+        end = raw_text.rfind("}")
+        if start == -1 or end < start:
+            raise
+    return orjson.loads(raw_text[start : end + 1])
@@ -0,0 +1,106 @@
+"""Schema-driven normalizers, specialized once per schema at import time."""
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Callable
+
+Normalizer = Callable[[Any], Any]
+
+# Upper bound on entries kept per array, so a runaway response stays small.
+DEFAULT_MAX_ITEMS = 50
+
+
+def _string(schema: dict) -> Normalizer:
+    max_length = schema.get("maxLength")
+
+    def normalize(value: Any) -> str:
+        if not isinstance(value, str):
+            return ""
+        return value.strip()[:max_length]
+
+    return normalize
+
+
+def _number(schema: dict) -> Normalizer:
+    low = schema.get("minimum", float("-inf"))
+    high = schema.get("maximum", float("inf"))
+
+    def normalize(value: Any) -> float:
+        if not isinstance(value, (int, float)):
+            value = 0
+        return max(low, min(high, float(value)))
+
+    return normalize
+
+
+def _string_array(item_schema: dict, max_items: int | None) -> Normalizer:
+    max_length = item_schema.get("maxLength")
+
+    def normalize(value: Any) -> list[str]:
+        if not isinstance(value, list):
+            return []
+        # Ordered dedupe that stops as soon as the cap is reached, so an
+        # oversized model response is never copied in full.
+        unique: dict[str, None] = {}
+        for item in value:
+            if not isinstance(item, str):
+                continue
+            text = item.strip()[:max_length]
+            if text:
+                unique[text] = None
+                if len(unique) == max_items:
+                    break
+        return list(unique)
+
+    return normalize
+
+
+def _object_array(item_schema: dict, max_items: int | None) -> Normalizer:
+    normalize_item = _object(item_schema, max_items)
+
+    def normalize(value: Any) -> list[dict]:
+        if not isinstance(value, list):
+            return []
+        items = (normalize_item(item) for item in value if isinstance(item, dict))
+        return list(islice((item for item in items if any(item.values())), max_items))
+
+    return normalize
+
+
+def _object(schema: dict, max_items: int | None) -> Normalizer:
+    fields = [
+        (name, build_normalizer(field_schema, max_items))
+        for name, field_schema in schema.get("properties", {}).items()
+    ]
+
+    def normalize(value: Any) -> dict:
+        if not isinstance(value, dict):
+            value = {}
+        return {name: normalize_field(value.get(name)) for name, normalize_field in fields}
+
+    return normalize
+
+
+def build_normalizer(schema: dict, max_items: int | None = DEFAULT_MAX_ITEMS) -> Normalizer:
+    """Build a normalizer that coerces model output towards ``schema``.
+
+    Strings are stripped and cut to ``maxLength``, numbers are clamped to
+    ``minimum``/``maximum``, string arrays drop blanks and duplicates, and
+    object arrays drop entries whose fields all come out empty. Every
+    array keeps at most ``max_items`` entries. Only the properties declared
+    in the schema are kept.
+    """
+    kind = schema.get("type")
+    if kind == "object":
+        return _object(schema, max_items)
+    if kind in ("number", "integer"):
+        return _number(schema)
+    if kind == "string":
+        return _string(schema)
+    if kind == "array":
+        item_schema = schema.get("items", {})
+        if item_schema.get("type") == "string":
+            return _string_array(item_schema, max_items)
+        if item_schema.get("type") == "object":
+            return _object_array(item_schema, max_items)
+    raise ValueError(f"Unsupported schema for normalization: {schema!r}")
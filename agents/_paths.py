@@ -0,0 +1,8 @@
+"""Repository paths shared by the agent modules."""
+from __future__ import annotations
+
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+PROMPTS_DIR = ROOT_DIR / "prompts"
+SCHEMAS_DIR = ROOT_DIR / "schemas"
@@ -2,29 +2,55 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+import re
+from functools import lru_cache
+from typing import Callable, Iterable
 
-from jsonschema import validate
+import orjson
 
-from llm_client import chat_completion, get_client_from_env_and_config
+from agents._json_utils import parse_json_object
+from agents._normalize import Normalizer, build_normalizer
+from agents._paths import PROMPTS_DIR, SCHEMAS_DIR
+from file_cache import cached_json, cached_text
+from llm_client import (
+    chat_completion,
+    get_client_from_env_and_config,
+    json_schema_response_format,
+    stream_chat_completion,
+)
+from schema_cache import get_validator
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-PROMPT_PATH = ROOT_DIR / "prompts" / "extract.txt"
-SCHEMA_PATH = ROOT_DIR / "schemas" / "facts.schema.json"
+PROMPT_PATH = PROMPTS_DIR / "extract.txt"
+SCHEMA_PATH = SCHEMAS_DIR / "facts.schema.json"
+
+_FACTS_ARRAY = re.compile(r'"facts"\s*:\s*\[')
+
+MAX_FACTS = 200
 
 
 def _load_prompt() -> str:
-    return PROMPT_PATH.read_text(encoding="utf-8")
+    return cached_text(PROMPT_PATH)
 
 
 def _load_schema() -> dict:
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return cached_json(SCHEMA_PATH)
+
+
+def _response_format() -> dict:
+    return json_schema_response_format("facts", _load_schema())
+
+
+@lru_cache(maxsize=None)
+def _fact_normalizer(max_facts: int) -> Normalizer:
+    return build_normalizer(_load_schema()["properties"]["facts"], max_facts)
 
 
 def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError:
+        return parse_json_object(raw_text)
+    except orjson.JSONDecodeError:
+        if not config.get("json_repair", False):
+            raise
         client = get_client_from_env_and_config(config)
         repair_messages = [
             {
@@ -45,52 +71,83 @@ def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
             messages=repair_messages,
             temperature=0.0,
             max_tokens=config.get("max_tokens", 1200),
+            response_format=_response_format(),
         )
-        return json.loads(repaired)
-
-
-def _normalize_facts(facts: list) -> list[str]:
-    cleaned = []
-    seen = set()
-    for fact in facts:
-        if not isinstance(fact, str):
-            continue
-        text = fact.strip()
-        if not text:
-            continue
-        if len(text) > 140:
-            text = text[:140]
-        if text in seen:
-            continue
-        cleaned.append(text)
-        seen.add(text)
-    return cleaned
-
-
-def run_extractor(text: str, config: dict) -> dict:
-    """Extract atomic facts from unstructured text."""
+        return parse_json_object(repaired)
+
+
+def _collect_stream(
+    chunks: Iterable[str],
+    on_fact: Callable[[str], None],
+    max_facts: int = MAX_FACTS,
+) -> str:
+    """Join streamed JSON, reporting each fact as soon as its string closes."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = None
+    reported = set()
+    for chunk in chunks:
+        buffer += chunk
+        if pos is None:
+            match = _FACTS_ARRAY.search(buffer)
+            if match is None:
+                continue
+            pos = match.end()
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer) or buffer[pos] != '"':
+                break
+            try:
+                value, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            for fact in _fact_normalizer(max_facts)([value]):
+                if fact not in reported and len(reported) < max_facts:
+                    reported.add(fact)
+                    on_fact(fact)
+    return buffer
+
+
+def run_extractor(
+    text: str,
+    config: dict,
+    on_fact: Callable[[str], None] | None = None,
+) -> dict:
+    """Extract atomic facts from unstructured text.
+
+    When ``on_fact`` is given the response is streamed and each fact is
+    passed to it as soon as it has been generated.
+    """
     prompt = _load_prompt()
     client = get_client_from_env_and_config(config)
+    max_facts = config.get("max_facts", MAX_FACTS)
 
     messages = [
         {"role": "system", "content": prompt},
         {"role": "user", "content": text},
     ]
 
-    raw = chat_completion(
-        client=client,
-        model=config.get("model", "gpt-4.1-mini"),
-        messages=messages,
-        temperature=config.get("temperature", 0.2),
-        max_tokens=config.get("max_tokens", 1200),
-    )
+    request = {
+        "client": client,
+        "model": config.get("model", "gpt-4.1-mini"),
+        "messages": messages,
+        "temperature": config.get("temperature", 0.2),
+        "max_tokens": config.get("max_tokens", 1200),
+        "response_format": _response_format(),
+    }
+    if on_fact is None:
+        raw = chat_completion(**request)
+    else:
+        raw = _collect_stream(stream_chat_completion(**request), on_fact, max_facts)
 
     data = _parse_json_or_repair(raw, config)
     if not isinstance(data, dict) or "facts" not in data:
         raise ValueError("Extractor output missing 'facts' key.")
 
-    facts = _normalize_facts(data.get("facts", []))
+    facts = _fact_normalizer(max_facts)(data.get("facts", []))
     result = {"facts": facts}
 
-    validate(instance=result, schema=_load_schema())
-    return result
\ No newline at end of file
+    get_validator(SCHEMA_PATH)(result)
+    return result
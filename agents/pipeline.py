@@ -0,0 +1,71 @@
+"""Pipeline: run the four agents as a single dependency graph."""
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from agents.extractor import run_extractor
+from agents.structurer import arun_structurer
+from agents.summarizer import arun_summarizer
+from agents.validator import arun_validator
+
+StageCallback = Callable[[tuple[str, ...]], None]
+FactCallback = Callable[[str], None]
+
+
+def empty_validation() -> dict:
+    """Validation report used when there is nothing to validate."""
+    return {
+        "coverage_score": 0,
+        "unsupported_claims": [],
+        "missing_topics": [],
+        "issues": ["No content to validate."],
+    }
+
+
+async def arun_chain(
+    text: str,
+    config: dict,
+    on_stage: StageCallback | None = None,
+    on_fact: FactCallback | None = None,
+) -> dict:
+    """Run extractor, then structurer and summarizer together, then validator."""
+
+    def enter(*stages: str) -> None:
+        if on_stage is not None:
+            on_stage(stages)
+
+    enter("extractor")
+    # Nothing else is in flight yet, so extract on the caller's thread; this
+    # keeps streamed on_fact callbacks on the thread that owns the UI.
+    facts = run_extractor(text, config, on_fact=on_fact)
+
+    enter("structurer", "summarizer")
+    outline, summary = await asyncio.gather(
+        arun_structurer(facts, config),
+        arun_summarizer(facts, config),
+    )
+
+    enter("validator")
+    if facts.get("facts") and summary.get("tldr"):
+        validation = await arun_validator(facts, outline, summary, config)
+    else:
+        # Nothing for the validator to check; skip the extra model call.
+        validation = empty_validation()
+
+    return {
+        "facts": facts,
+        "outline": outline,
+        "summary": summary,
+        "validation": validation,
+    }
+
+
+def run_chain(
+    text: str,
+    config: dict,
+    on_stage: StageCallback | None = None,
+    on_fact: FactCallback | None = None,
+) -> dict:
+    """Synchronous entry point for callers without an event loop."""
+    return asyncio.run(arun_chain(text, config, on_stage, on_fact))
@@ -1,30 +1,46 @@
 """Structurer agent: organize extracted facts into a coherent outline."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import asyncio
 
-from jsonschema import validate
+import orjson
 
-from llm_client import chat_completion, get_client_from_env_and_config
+from agents._json_utils import parse_json_object
+from agents._normalize import build_normalizer
+from agents._paths import PROMPTS_DIR, SCHEMAS_DIR
+from file_cache import cached_json, cached_text
+from llm_client import (
+    chat_completion,
+    get_client_from_env_and_config,
+    json_schema_response_format,
+)
+from schema_cache import get_validator
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-PROMPT_PATH = ROOT_DIR / "prompts" / "structure.txt"
-SCHEMA_PATH = ROOT_DIR / "schemas" / "outline.schema.json"
+PROMPT_PATH = PROMPTS_DIR / "structure.txt"
+SCHEMA_PATH = SCHEMAS_DIR / "outline.schema.json"
 
 
 def _load_prompt() -> str:
-    return PROMPT_PATH.read_text(encoding="utf-8")
+    return cached_text(PROMPT_PATH)
 
 
 def _load_schema() -> dict:
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return cached_json(SCHEMA_PATH)
+
+
+def _response_format() -> dict:
+    return json_schema_response_format("outline", _load_schema())
+
+
+_normalize_outline = build_normalizer(_load_schema())
 
 
 def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError:
+        return parse_json_object(raw_text)
+    except orjson.JSONDecodeError:
+        if not config.get("json_repair", False):
+            raise
         client = get_client_from_env_and_config(config)
         repair_messages = [
             {
@@ -46,44 +62,9 @@ def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
             messages=repair_messages,
             temperature=0.0,
             max_tokens=config.get("max_tokens", 1200),
+            response_format=_response_format(),
         )
-        return json.loads(repaired)
-
-
-def _normalize_outline(data: dict) -> dict:
-    title = data.get("title")
-    if not isinstance(title, str):
-        title = ""
-    title = title.strip()
-
-    sections = []
-    raw_sections = data.get("sections", [])
-    if isinstance(raw_sections, list):
-        for section in raw_sections:
-            if not isinstance(section, dict):
-                continue
-            heading = section.get("heading", "")
-            if not isinstance(heading, str):
-                heading = ""
-            heading = heading.strip()
-
-            bullets = []
-            seen = set()
-            raw_bullets = section.get("bullets", [])
-            if isinstance(raw_bullets, list):
-                for bullet in raw_bullets:
-                    if not isinstance(bullet, str):
-                        continue
-                    text = bullet.strip()
-                    if not text or text in seen:
-                        continue
-                    bullets.append(text)
-                    seen.add(text)
-
-            if heading or bullets:
-                sections.append({"heading": heading, "bullets": bullets})
-
-    return {"title": title, "sections": sections}
+        return parse_json_object(repaired)
 
 
 def run_structurer(facts: dict, config: dict) -> dict:
@@ -93,7 +74,7 @@ def run_structurer(facts: dict, config: dict) -> dict:
 
     messages = [
         {"role": "system", "content": prompt},
-        {"role": "user", "content": json.dumps(facts, indent=2)},
+        {"role": "user", "content": orjson.dumps(facts).decode()},
     ]
 
     raw = chat_completion(
@@ -102,6 +83,7 @@ def run_structurer(facts: dict, config: dict) -> dict:
         messages=messages,
         temperature=config.get("temperature", 0.2),
         max_tokens=config.get("max_tokens", 1200),
+        response_format=_response_format(),
     )
 
     data = _parse_json_or_repair(raw, config)
@@ -109,5 +91,10 @@ def run_structurer(facts: dict, config: dict) -> dict:
         raise ValueError("Structurer output is not a JSON object.")
 
     outline = _normalize_outline(data)
-    validate(instance=outline, schema=_load_schema())
+    get_validator(SCHEMA_PATH)(outline)
     return outline
+
+
+async def arun_structurer(facts: dict, config: dict) -> dict:
+    """Async wrapper around run_structurer for concurrent pipeline stages."""
+    return await asyncio.to_thread(run_structurer, facts, config)
@@ -1,30 +1,46 @@
-"""Summarizer agent: generate an executive summary from the outline."""
+"""Summarizer agent: generate an executive summary from the extracted facts."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import asyncio
 
-from jsonschema import validate
+import orjson
 
-from llm_client import chat_completion, get_client_from_env_and_config
+from agents._json_utils import parse_json_object
+from agents._normalize import build_normalizer
+from agents._paths import PROMPTS_DIR, SCHEMAS_DIR
+from file_cache import cached_json, cached_text
+from llm_client import (
+    chat_completion,
+    get_client_from_env_and_config,
+    json_schema_response_format,
+)
+from schema_cache import get_validator
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-PROMPT_PATH = ROOT_DIR / "prompts" / "summarize.txt"
-SCHEMA_PATH = ROOT_DIR / "schemas" / "summary.schema.json"
+PROMPT_PATH = PROMPTS_DIR / "summarize.txt"
+SCHEMA_PATH = SCHEMAS_DIR / "summary.schema.json"
 
 
 def _load_prompt() -> str:
-    return PROMPT_PATH.read_text(encoding="utf-8")
+    return cached_text(PROMPT_PATH)
 
 
 def _load_schema() -> dict:
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return cached_json(SCHEMA_PATH)
+
+
+def _response_format() -> dict:
+    return json_schema_response_format("summary", _load_schema())
+
+
+_normalize_summary = build_normalizer(_load_schema())
 
 
 def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError:
+        return parse_json_object(raw_text)
+    except orjson.JSONDecodeError:
+        if not config.get("json_repair", False):
+            raise
         client = get_client_from_env_and_config(config)
         repair_messages = [
             {
@@ -46,50 +62,19 @@ def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
             messages=repair_messages,
             temperature=0.0,
             max_tokens=config.get("max_tokens", 1200),
+            response_format=_response_format(),
         )
-        return json.loads(repaired)
-
-
-def _clean_list(values: list) -> list[str]:
-    cleaned = []
-    seen = set()
-    for value in values:
-        if not isinstance(value, str):
-            continue
-        text = value.strip()
-        if not text or text in seen:
-            continue
-        cleaned.append(text)
-        seen.add(text)
-    return cleaned
-
-
-def _normalize_summary(data: dict) -> dict:
-    tldr = data.get("tldr", "")
-    if not isinstance(tldr, str):
-        tldr = ""
-    tldr = tldr.strip()
-
-    key_points = _clean_list(data.get("key_points", []))
-    risks = _clean_list(data.get("risks", []))
-    recommendations = _clean_list(data.get("recommendations", []))
-
-    return {
-        "tldr": tldr,
-        "key_points": key_points,
-        "risks": risks,
-        "recommendations": recommendations,
-    }
-
-
-def run_summarizer(outline: dict, config: dict) -> dict:
-    """Summarize the outline for executive consumption."""
+        return parse_json_object(repaired)
+
+
+def run_summarizer(facts: dict, config: dict) -> dict:
+    """Summarize the extracted facts for executive consumption."""
     prompt = _load_prompt()
     client = get_client_from_env_and_config(config)
 
     messages = [
         {"role": "system", "content": prompt},
-        {"role": "user", "content": json.dumps(outline, indent=2)},
+        {"role": "user", "content": orjson.dumps(facts).decode()},
     ]
 
     raw = chat_completion(
@@ -98,6 +83,7 @@ def run_summarizer(outline: dict, config: dict) -> dict:
         messages=messages,
         temperature=config.get("temperature", 0.2),
         max_tokens=config.get("max_tokens", 1200),
+        response_format=_response_format(),
     )
 
     data = _parse_json_or_repair(raw, config)
@@ -105,5 +91,10 @@ def run_summarizer(outline: dict, config: dict) -> dict:
         raise ValueError("Summarizer output is not a JSON object.")
 
     summary = _normalize_summary(data)
-    validate(instance=summary, schema=_load_schema())
+    get_validator(SCHEMA_PATH)(summary)
     return summary
+
+
+async def arun_summarizer(facts: dict, config: dict) -> dict:
+    """Async wrapper around run_summarizer for concurrent pipeline stages."""
+    return await asyncio.to_thread(run_summarizer, facts, config)
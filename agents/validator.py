@@ -1,30 +1,46 @@
 """Validator agent: check outputs for consistency and unsupported claims."""
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import asyncio
 
-from jsonschema import validate
+import orjson
 
-from llm_client import chat_completion, get_client_from_env_and_config
+from agents._json_utils import parse_json_object
+from agents._normalize import build_normalizer
+from agents._paths import PROMPTS_DIR, SCHEMAS_DIR
+from file_cache import cached_json, cached_text
+from llm_client import (
+    chat_completion,
+    get_client_from_env_and_config,
+    json_schema_response_format,
+)
+from schema_cache import get_validator
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-PROMPT_PATH = ROOT_DIR / "prompts" / "validate.txt"
-SCHEMA_PATH = ROOT_DIR / "schemas" / "validation.schema.json"
+PROMPT_PATH = PROMPTS_DIR / "validate.txt"
+SCHEMA_PATH = SCHEMAS_DIR / "validation.schema.json"
 
 
 def _load_prompt() -> str:
-    return PROMPT_PATH.read_text(encoding="utf-8")
+    return cached_text(PROMPT_PATH)
 
 
 def _load_schema() -> dict:
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return cached_json(SCHEMA_PATH)
+
+
+def _response_format() -> dict:
+    return json_schema_response_format("validation", _load_schema())
+
+
+_normalize_validation = build_normalizer(_load_schema())
 
 
 def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError:
+        return parse_json_object(raw_text)
+    except orjson.JSONDecodeError:
+        if not config.get("json_repair", False):
+            raise
         client = get_client_from_env_and_config(config)
         repair_messages = [
             {
@@ -46,40 +62,9 @@ def _parse_json_or_repair(raw_text: str, config: dict) -> dict:
             messages=repair_messages,
             temperature=0.0,
             max_tokens=config.get("max_tokens", 1200),
+            response_format=_response_format(),
         )
-        return json.loads(repaired)
-
-
-def _clean_list(values: list) -> list[str]:
-    cleaned = []
-    seen = set()
-    for value in values:
-        if not isinstance(value, str):
-            continue
-        text = value.strip()
-        if not text or text in seen:
-            continue
-        cleaned.append(text)
-        seen.add(text)
-    return cleaned
-
-
-def _normalize_validation(data: dict) -> dict:
-    coverage_score = data.get("coverage_score")
-    if not isinstance(coverage_score, (int, float)):
-        coverage_score = 0
-    coverage_score = max(0, min(100, float(coverage_score)))
-
-    unsupported_claims = _clean_list(data.get("unsupported_claims", []))
-    missing_topics = _clean_list(data.get("missing_topics", []))
-    issues = _clean_list(data.get("issues", []))
-
-    return {
-        "coverage_score": coverage_score,
-        "unsupported_claims": unsupported_claims,
-        "missing_topics": missing_topics,
-        "issues": issues,
-    }
+        return parse_json_object(repaired)
 
 
 def run_validator(facts: dict, outline: dict, summary: dict, config: dict) -> dict:
@@ -94,7 +79,7 @@ def run_validator(facts: dict, outline: dict, summary: dict, config: dict) -> di
     }
     messages = [
         {"role": "system", "content": prompt},
-        {"role": "user", "content": json.dumps(payload, indent=2)},
+        {"role": "user", "content": orjson.dumps(payload).decode()},
     ]
 
     raw = chat_completion(
@@ -103,6 +88,7 @@ def run_validator(facts: dict, outline: dict, summary: dict, config: dict) -> di
         messages=messages,
         temperature=config.get("temperature", 0.2),
         max_tokens=config.get("max_tokens", 1200),
+        response_format=_response_format(),
     )
 
     data = _parse_json_or_repair(raw, config)
@@ -110,5 +96,10 @@ def run_validator(facts: dict, outline: dict, summary: dict, config: dict) -> di
         raise ValueError("Validator output is not a JSON object.")
 
     validation = _normalize_validation(data)
-    validate(instance=validation, schema=_load_schema())
+    get_validator(SCHEMA_PATH)(validation)
     return validation
+
+
+async def arun_validator(facts: dict, outline: dict, summary: dict, config: dict) -> dict:
+    """Async wrapper around run_validator for concurrent pipeline stages."""
+    return await asyncio.to_thread(run_validator, facts, outline, summary, config)
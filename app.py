@@ -1,76 +1,46 @@
 from __future__ import annotations
 
-import json
 import os
+import threading
 from pathlib import Path
 
 import streamlit as st
-import yaml
-from jsonschema import validate
 
-from agents.extractor import run_extractor
-from agents.structurer import run_structurer
-from agents.summarizer import run_summarizer
-from agents.validator import run_validator
+from agents._paths import PROMPTS_DIR, SCHEMAS_DIR
+from agents.pipeline import run_chain
+from file_cache import cached_text, cached_yaml
+from output_writer import write_outputs
+from schema_cache import get_validator
 
 ROOT_DIR = Path(__file__).resolve().parent
-SCHEMAS_DIR = ROOT_DIR / "schemas"
 OUTPUTS_DIR = ROOT_DIR / "outputs"
 CONFIG_PATH = ROOT_DIR / "config.yaml"
 SAMPLE_DOC = ROOT_DIR / "sample_docs" / "sample.txt"
 
 
-def load_schema(filename: str) -> dict:
-    return json.loads((SCHEMAS_DIR / filename).read_text(encoding="utf-8"))
-
-
 def load_config() -> dict:
-    return yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
-
-
-def validate_outputs(outputs: dict) -> None:
-    schema_map = {
-        "facts": "facts.schema.json",
-        "outline": "outline.schema.json",
-        "summary": "summary.schema.json",
-        "validation": "validation.schema.json",
-    }
-    for key, schema_file in schema_map.items():
-        schema = load_schema(schema_file)
-        validate(instance=outputs[key], schema=schema)
-
-
-def write_outputs(outputs: dict, raw_text: str) -> list[Path]:
-    OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
-
-    file_map = {
-        "facts": OUTPUTS_DIR / "facts.json",
-        "outline": OUTPUTS_DIR / "outline.json",
-        "summary": OUTPUTS_DIR / "summary.json",
-        "validation": OUTPUTS_DIR / "validation_report.json",
-    }
-
-    written = []
-    for key, path in file_map.items():
-        path.write_text(json.dumps(outputs[key], indent=2), encoding="utf-8")
-        written.append(path)
-
-    trace = {
-        "raw_text": raw_text,
-        "facts": outputs["facts"],
-        "outline": outputs["outline"],
-        "summary": outputs["summary"],
-        "validation": outputs["validation"],
-    }
-    trace_path = OUTPUTS_DIR / "trace.json"
-    trace_path.write_text(json.dumps(trace, indent=2), encoding="utf-8")
-    written.append(trace_path)
-
-    return written
+    return cached_yaml(CONFIG_PATH) or {}
 
 
 def load_sample_text() -> str:
-    return SAMPLE_DOC.read_text(encoding="utf-8")
+    return cached_text(SAMPLE_DOC)
+
+
+def warm_caches() -> None:
+    load_sample_text()
+    load_config()
+    for prompt_path in PROMPTS_DIR.glob("*.txt"):
+        cached_text(prompt_path)
+    for schema_path in SCHEMAS_DIR.glob("*.schema.json"):
+        get_validator(schema_path)
+
+
+@st.cache_resource(show_spinner=False)
+def start_cache_warmup() -> threading.Thread:
+    # cache_resource makes this once per server process, not once per rerun.
+    thread = threading.Thread(target=warm_caches, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 def init_state() -> None:
@@ -85,8 +55,10 @@ def init_state() -> None:
 def render_styles() -> None:
     st.markdown(
         """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap">
         <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap');
         html, body, [class*="css"]  {
             font-family: "Space Grotesk", "Segoe UI", Arial, sans-serif;
             color: #1b1f24;
@@ -147,9 +119,14 @@ def render_styles() -> None:
     )
 
 
-def render_chain(container: st.delta_generator.DeltaGenerator, active: str | None) -> None:
+def render_chain(
+    container: st.delta_generator.DeltaGenerator,
+    active: str | tuple[str, ...] | None,
+) -> None:
+    active_keys = (active,) if isinstance(active, str) else active or ()
+
     def card(title: str, desc: str, key: str) -> str:
-        active_class = "active" if active == key else ""
+        active_class = "active" if key in active_keys else ""
         return (
             f'<div class="chain-card {active_class}">'
             f'<div class="chain-title">{title}</div>'
@@ -162,7 +139,7 @@ def render_chain(container: st.delta_generator.DeltaGenerator, active: str | Non
         <div class="chain-grid">
           {card("Extractor", "Atomic facts from messy text.", "extractor")}
           {card("Structurer", "Outline built from facts.", "structurer")}
-          {card("Summarizer", "Executive summary artifacts.", "summarizer")}
+          {card("Summarizer", "Executive summary from facts.", "summarizer")}
           {card("Validator", "Coverage and support checks.", "validator")}
         </div>
         """,
@@ -170,30 +147,32 @@ def render_chain(container: st.delta_generator.DeltaGenerator, active: str | Non
     )
 
 
-def run_pipeline(doc_text: str, chain_container: st.delta_generator.DeltaGenerator) -> dict:
+def run_pipeline(
+    doc_text: str,
+    chain_container: st.delta_generator.DeltaGenerator,
+    facts_container: st.delta_generator.DeltaGenerator,
+) -> dict:
     config = load_config()
-    render_chain(chain_container, "extractor")
-    facts = run_extractor(doc_text, config)
-    render_chain(chain_container, "structurer")
-    outline = run_structurer(facts, config)
-    render_chain(chain_container, "summarizer")
-    summary = run_summarizer(outline, config)
-    render_chain(chain_container, "validator")
-    validation = run_validator(facts, outline, summary, config)
-
-    outputs = {
-        "facts": facts,
-        "outline": outline,
-        "summary": summary,
-        "validation": validation,
-    }
-    validate_outputs(outputs)
-    write_outputs(outputs, doc_text)
+    streamed_facts: list[str] = []
+
+    def show_fact(fact: str) -> None:
+        streamed_facts.append(fact)
+        facts_container.markdown("\n".join(f"- {item}" for item in streamed_facts))
+
+    outputs = run_chain(
+        doc_text,
+        config,
+        on_stage=lambda stages: render_chain(chain_container, stages),
+        on_fact=show_fact,
+    )
+    facts_container.empty()
+    write_outputs(outputs, doc_text, OUTPUTS_DIR)
     return outputs
 
 
 def main() -> None:
     st.set_page_config(page_title="Prompt Chaining Demo", page_icon="🧩", layout="wide")
+    start_cache_warmup()
     render_styles()
     init_state()
 
@@ -209,6 +188,7 @@ def main() -> None:
     st.markdown('<span class="pill">Chain</span>', unsafe_allow_html=True)
     chain_container = st.empty()
     render_chain(chain_container, None)
+    facts_container = st.empty()
 
     col_input, col_controls = st.columns([3, 1])
     with col_input:
@@ -226,6 +206,7 @@ def main() -> None:
                     st.session_state.results = run_pipeline(
                         st.session_state.doc_text,
                         chain_container,
+                        facts_container,
                     )
                     st.session_state.error = None
             except Exception as exc:
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CACHE: dict[tuple[str, str], tuple[int, Any]] = {}
+
+
+def _cached(path: str | Path, kind: str, load: Callable[[Path], Any]) -> Any:
+    key = (str(path), kind)
+    mtime_ns = os.stat(path).st_mtime_ns
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    value = load(Path(path))
+    _CACHE[key] = (mtime_ns, value)
+    return value
+
+
+def cached_text(path: str | Path) -> str:
+    """Read a UTF-8 text file, re-reading only when its mtime changes."""
+    return _cached(path, "text", lambda p: p.read_text(encoding="utf-8"))
+
+
+def cached_json(path: str | Path) -> Any:
+    """Parse a JSON file, re-parsing only when its mtime changes."""
+    return _cached(path, "json", lambda p: orjson.loads(p.read_bytes()))
+
+
+def cached_yaml(path: str | Path) -> Any:
+    """Parse a YAML file, re-parsing only when its mtime changes."""
+    return _cached(path, "yaml", lambda p: yaml.load(p.read_bytes(), Loader=_YAML_LOADER))
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from typing import Any, Iterator
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 from dotenv import load_dotenv
 
 
@@ -12,16 +15,98 @@ def get_client_from_env_and_config(config: dict) -> OpenAI:
     if not api_key:
         raise ValueError("OPENAI_API_KEY is not set.")
 
-    return OpenAI(api_key=api_key)
+    return _build_client(api_key, config.get("base_url"))
 
 
-def chat_completion(client: OpenAI, model: str, messages: list[dict], temperature: float, max_tokens: int) -> str:
+@lru_cache(maxsize=8)
+def _build_client(api_key: str, base_url: str | None) -> OpenAI:
+    # One client per key/endpoint so every agent shares its keep-alive pool;
+    # over HTTP/2 the concurrent stages multiplex on a single connection.
+    http_client = DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+# JSON Schema keywords that strict structured outputs reject; the agents
+# still enforce them locally when validating against the full schema.
+_UNSUPPORTED_STRICT_KEYWORDS = {"$schema", "maxLength"}
+
+
+def _strict_schema(schema: Any) -> Any:
+    if isinstance(schema, dict):
+        return {
+            key: _strict_schema(value)
+            for key, value in schema.items()
+            if key not in _UNSUPPORTED_STRICT_KEYWORDS
+        }
+    if isinstance(schema, list):
+        return [_strict_schema(value) for value in schema]
+    return schema
+
+
+def json_schema_response_format(name: str, schema: dict) -> dict:
+    """Build a strict structured-output ``response_format`` from a JSON schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": _strict_schema(schema),
+            "strict": True,
+        },
+    }
+
+
+def chat_completion(
+    client: OpenAI,
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict | None = None,
+) -> str:
+    kwargs = {}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+
     response = client.chat.completions.create(
         model=model,
         messages=messages,
         temperature=temperature,
         max_tokens=max_tokens,
+        **kwargs,
     )
 
     message = response.choices[0].message
     return message.content or ""
+
+
+def stream_chat_completion(
+    client: OpenAI,
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict | None = None,
+) -> Iterator[str]:
+    kwargs = {}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+        **kwargs,
+    )
+
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            yield content
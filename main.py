@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-import yaml
-from jsonschema import validate
-
-from agents.extractor import run_extractor
-from agents.structurer import run_structurer
-from agents.summarizer import run_summarizer
-from agents.validator import run_validator
+from agents.pipeline import run_chain
+from file_cache import cached_text, cached_yaml
+from output_writer import write_outputs
+from schema_cache import get_validator
 
 ROOT_DIR = Path(__file__).resolve().parent
 SCHEMAS_DIR = ROOT_DIR / "schemas"
@@ -18,13 +14,8 @@ OUTPUTS_DIR = ROOT_DIR / "outputs"
 CONFIG_PATH = ROOT_DIR / "config.yaml"
 
 
-def load_schema(filename: str) -> dict:
-    schema_path = SCHEMAS_DIR / filename
-    return json.loads(schema_path.read_text(encoding="utf-8"))
-
-
 def load_config() -> dict:
-    return yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8")) or {}
+    return cached_yaml(CONFIG_PATH) or {}
 
 
 def build_placeholders(
@@ -107,56 +98,17 @@ def validate_outputs(outputs: dict) -> None:
         "validation": "validation.schema.json",
     }
     for key, schema_file in schema_map.items():
-        schema = load_schema(schema_file)
-        validate(instance=outputs[key], schema=schema)
-
-
-def write_outputs(outputs: dict, raw_text: str) -> list[Path]:
-    OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
-
-    file_map = {
-        "facts": OUTPUTS_DIR / "facts.json",
-        "outline": OUTPUTS_DIR / "outline.json",
-        "summary": OUTPUTS_DIR / "summary.json",
-        "validation": OUTPUTS_DIR / "validation_report.json",
-    }
-
-    written = []
-    for key, path in file_map.items():
-        path.write_text(json.dumps(outputs[key], indent=2), encoding="utf-8")
-        written.append(path)
-
-    trace = {
-        "raw_text": raw_text,
-        "facts": outputs["facts"],
-        "outline": outputs["outline"],
-        "summary": outputs["summary"],
-        "validation": outputs["validation"],
-    }
-    trace_path = OUTPUTS_DIR / "trace.json"
-    trace_path.write_text(json.dumps(trace, indent=2), encoding="utf-8")
-    written.append(trace_path)
-
-    return written
+        get_validator(SCHEMAS_DIR / schema_file)(outputs[key])
 
 
 def main() -> None:
     config = load_config()
-    raw_text = SAMPLE_DOC.read_text(encoding="utf-8")
-
-    facts = run_extractor(raw_text, config)
-    outline = run_structurer(facts, config)
-    summary = run_summarizer(outline, config)
-    validation = run_validator(facts, outline, summary, config)
-    outputs = build_placeholders(
-        raw_text,
-        facts=facts,
-        outline=outline,
-        summary=summary,
-        validation=validation,
-    )
+    raw_text = cached_text(SAMPLE_DOC)
+
+    stages = run_chain(raw_text, config)
+    outputs = build_placeholders(raw_text, **stages)
     validate_outputs(outputs)
-    written = write_outputs(outputs, raw_text)
+    written = write_outputs(outputs, raw_text, OUTPUTS_DIR)
 
     rel_paths = [str(path.relative_to(ROOT_DIR)) for path in written]
     print("Wrote: " + ", ".join(rel_paths))
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
+
+ARTIFACT_FILES = {
+    "facts": "facts.json",
+    "outline": "outline.json",
+    "summary": "summary.json",
+    "validation": "validation_report.json",
+}
+
+
+def build_trace(raw_text: str, serialized: dict[str, bytes]) -> bytes:
+    """Nest already-serialized artifacts into trace.json without dumping them again.
+
+    Equals ``orjson.dumps(trace, option=orjson.OPT_INDENT_2)`` because orjson
+    escapes newlines inside strings, so every raw newline in ``serialized`` is
+    indentation that only needs shifting one level deeper.
+    """
+    items = [("raw_text", orjson.dumps(raw_text)), *serialized.items()]
+    return (
+        b"{\n"
+        + b",\n".join(
+            b'  "' + key.encode() + b'": ' + data.replace(b"\n", b"\n  ")
+            for key, data in items
+        )
+        + b"\n}"
+    )
+
+
+def write_outputs(outputs: dict, raw_text: str, outputs_dir: Path) -> list[Path]:
+    """Write each artifact and trace.json to ``outputs_dir`` concurrently."""
+    outputs_dir.mkdir(parents=True, exist_ok=True)
+
+    serialized = {
+        key: orjson.dumps(outputs[key], option=orjson.OPT_INDENT_2) for key in ARTIFACT_FILES
+    }
+
+    written = [outputs_dir / name for name in ARTIFACT_FILES.values()]
+    written.append(outputs_dir / "trace.json")
+    contents = [*serialized.values(), build_trace(raw_text, serialized)]
+    with ThreadPoolExecutor(max_workers=len(written)) as executor:
+        list(executor.map(Path.write_bytes, written, contents))
+
+    return written
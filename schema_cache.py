@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import fastjsonschema
+
+from file_cache import cached_json
+
+
+def get_validator(path: str | Path) -> Callable[[Any], Any]:
+    """Return a compiled validation function for the schema at ``path``."""
+    path = Path(path)
+    return _compile(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _compile(path: Path, mtime_ns: int) -> Callable[[Any], Any]:
+    return fastjsonschema.compile(cached_json(path))
@@ -0,0 +1,50 @@
+"""Generated by tools/bake_schemas.py from schemas/*.schema.json; do not edit."""
+
+SCHEMAS = {'facts': {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+           'type': 'object',
+           'additionalProperties': False,
+           'required': ['facts'],
+           'properties': {'facts': {'type': 'array',
+                                    'minItems': 3,
+                                    'items': {'type': 'string',
+                                              'maxLength': 140}}}},
+ 'outline': {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+             'type': 'object',
+             'additionalProperties': False,
+             'required': ['title', 'sections'],
+             'properties': {'title': {'type': 'string'},
+                            'sections': {'type': 'array',
+                                         'items': {'type': 'object',
+                                                   'additionalProperties': False,
+                                                   'required': ['heading',
+                                                                'bullets'],
+                                                   'properties': {'heading': {'type': 'string'},
+                                                                  'bullets': {'type': 'array',
+                                                                              'items': {'type': 'string'}}}}}}},
+ 'summary': {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+             'type': 'object',
+             'additionalProperties': False,
+             'required': ['tldr', 'key_points', 'risks', 'recommendations'],
+             'properties': {'tldr': {'type': 'string'},
+                            'key_points': {'type': 'array',
+                                           'items': {'type': 'string'}},
+                            'risks': {'type': 'array',
+                                      'items': {'type': 'string'}},
+                            'recommendations': {'type': 'array',
+                                                'items': {'type': 'string'}}}},
+ 'validation': {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+                'type': 'object',
+                'additionalProperties': False,
+                'required': ['coverage_score',
+                             'unsupported_claims',
+                             'missing_topics',
+                             'issues'],
+                'properties': {'coverage_score': {'type': 'number',
+                                                  'minimum': 0,
+                                                  'maximum': 100},
+                               'unsupported_claims': {'type': 'array',
+                                                      'items': {'type': 'string'}},
+                               'missing_topics': {'type': 'array',
+                                                  'items': {'type': 'string'}},
+                               'issues': {'type': 'array',
+                                          'items': {'type': 'string'}}}}}
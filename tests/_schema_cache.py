@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable
+
+import fastjsonschema
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+# Every schemas/*.schema.json keyed by artifact name, baked by tools/bake_schemas.py.
+from tests._baked_schemas import SCHEMAS
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str) -> Validator:
+    """Build one checked jsonschema validator per schema for the suite."""
+    schema = SCHEMAS[name]
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+_COMPILED: dict[str, Callable[[Any], Any]] = {
+    name: fastjsonschema.compile(schema) for name, schema in SCHEMAS.items()
+}
+
+
+def assert_valid(name: str, instance: Any) -> None:
+    """Validate against a compiled schema, using jsonschema only to report failures."""
+    try:
+        _COMPILED[name](instance)
+    except fastjsonschema.JsonSchemaValueException:
+        # jsonschema's ValidationError carries the full path and context.
+        get_validator(name).validate(instance)
+        raise
@@ -0,0 +1,14 @@
+import orjson
+
+from tests._baked_schemas import SCHEMAS
+from tools.bake_schemas import OUTPUT_PATH, SCHEMAS_DIR, render
+
+
+def test_baked_module_is_current() -> None:
+    assert OUTPUT_PATH.read_text(encoding="utf-8") == render()
+
+
+def test_baked_schemas_match_json_files() -> None:
+    for name, schema in SCHEMAS.items():
+        path = SCHEMAS_DIR / f"{name}.schema.json"
+        assert schema == orjson.loads(path.read_bytes())
@@ -0,0 +1,13 @@
+import json
+
+from agents.extractor import _collect_stream
+
+
+def test_collect_stream_reports_facts_as_they_complete() -> None:
+    chunks = ['{"fa', 'cts": ["Revenue up', ' 12%."', ', "Refunds \\"spiked\\""', ', " Revenue up 12%. "]}']
+    seen = []
+
+    raw = _collect_stream(chunks, seen.append)
+
+    assert seen == ["Revenue up 12%.", 'Refunds "spiked"']
+    assert json.loads(raw)["facts"][1] == 'Refunds "spiked"'
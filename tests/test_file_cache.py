@@ -0,0 +1,21 @@
+import os
+
+from file_cache import cached_json, cached_text
+
+
+def test_cached_text_rereads_after_mtime_change(tmp_path) -> None:
+    path = tmp_path / "prompt.txt"
+    path.write_text("first", encoding="utf-8")
+    assert cached_text(path) == "first"
+
+    path.write_text("second", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cached_text(path) == "second"
+
+
+def test_cached_json_returns_same_object_while_unchanged(tmp_path) -> None:
+    path = tmp_path / "schema.json"
+    path.write_text('{"type": "object"}', encoding="utf-8")
+
+    assert cached_json(path) is cached_json(path)
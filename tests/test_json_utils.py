@@ -0,0 +1,24 @@
+import orjson
+import pytest
+
+from agents._json_utils import parse_json_object
+
+
+def test_parses_plain_json() -> None:
+    assert parse_json_object('{"facts": ["a"]}') == {"facts": ["a"]}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '```json\n{"facts": ["a"]}\n```',
+        'Here is the JSON:\n{"facts": ["a"]}\nLet me know if you need more.',
+    ],
+)
+def test_recovers_object_from_wrapped_output(raw: str) -> None:
+    assert parse_json_object(raw) == {"facts": ["a"]}
+
+
+def test_raises_when_no_object_can_be_recovered() -> None:
+    with pytest.raises(orjson.JSONDecodeError):
+        parse_json_object("no json here")
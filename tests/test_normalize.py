@@ -0,0 +1,36 @@
+from agents._normalize import build_normalizer
+from tests._schema_cache import SCHEMAS
+
+
+def test_outline_normalizer_cleans_sections() -> None:
+    normalize = build_normalizer(SCHEMAS["outline"])
+
+    outline = normalize(
+        {
+            "title": "  Q3  ",
+            "sections": [
+                {"heading": " Ops ", "bullets": [" a", "a", 3, ""], "extra": 1},
+                {"heading": "", "bullets": []},
+                "not a section",
+            ],
+        }
+    )
+
+    assert outline == {"title": "Q3", "sections": [{"heading": "Ops", "bullets": ["a"]}]}
+
+
+def test_schema_bounds_are_applied() -> None:
+    normalize_facts = build_normalizer(SCHEMAS["facts"])
+    normalize_validation = build_normalizer(SCHEMAS["validation"])
+
+    assert normalize_facts({"facts": ["x" * 200]}) == {"facts": ["x" * 140]}
+    assert normalize_validation({"coverage_score": 250})["coverage_score"] == 100
+    assert normalize_validation({"coverage_score": "high"})["coverage_score"] == 0
+
+
+def test_arrays_are_capped() -> None:
+    normalize = build_normalizer(SCHEMAS["summary"], max_items=2)
+
+    summary = normalize({"tldr": "t", "key_points": ["a", "a", "b", "c"], "risks": [], "recommendations": []})
+
+    assert summary["key_points"] == ["a", "b"]
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import orjson
+
+from output_writer import ARTIFACT_FILES, write_outputs
+
+
+def test_write_outputs_matches_full_dump(tmp_path: Path, placeholders: dict) -> None:
+    raw_text = "Résumé of Q3 — revenue ↑12%.\nSecond line\n\n\tTabbed \"quoted\" line.\n"
+    outputs = {key: placeholders[key] for key in ARTIFACT_FILES}
+    outputs["summary"] = {**outputs["summary"], "tldr": "Naïve churn model.\nNeeds review."}
+
+    written = write_outputs(outputs, raw_text, tmp_path)
+
+    assert [path.name for path in written] == [*ARTIFACT_FILES.values(), "trace.json"]
+    for key, name in ARTIFACT_FILES.items():
+        assert orjson.loads((tmp_path / name).read_bytes()) == outputs[key]
+
+    trace = {"raw_text": raw_text, **outputs}
+    expected = orjson.dumps(trace, option=orjson.OPT_INDENT_2)
+    assert (tmp_path / "trace.json").read_bytes() == expected
@@ -0,0 +1,24 @@
+from agents import pipeline
+
+
+def test_validator_is_skipped_without_summary(monkeypatch) -> None:
+    async def fake_structurer(facts: dict, config: dict) -> dict:
+        return {"title": "", "sections": []}
+
+    async def fake_summarizer(facts: dict, config: dict) -> dict:
+        return {"tldr": "", "key_points": [], "risks": [], "recommendations": []}
+
+    async def fail_validator(*args) -> dict:
+        raise AssertionError("validator should not be called")
+
+    def fake_extractor(text: str, config: dict, on_fact=None) -> dict:
+        return {"facts": ["a", "b", "c"]}
+
+    monkeypatch.setattr(pipeline, "run_extractor", fake_extractor)
+    monkeypatch.setattr(pipeline, "arun_structurer", fake_structurer)
+    monkeypatch.setattr(pipeline, "arun_summarizer", fake_summarizer)
+    monkeypatch.setattr(pipeline, "arun_validator", fail_validator)
+
+    outputs = pipeline.run_chain("text", {})
+
+    assert outputs["validation"] == pipeline.empty_validation()
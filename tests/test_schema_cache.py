@@ -0,0 +1,19 @@
+import pytest
+from fastjsonschema import JsonSchemaValueException
+
+from agents._paths import SCHEMAS_DIR
+from schema_cache import get_validator
+
+SCHEMA_PATH = SCHEMAS_DIR / "facts.schema.json"
+
+
+def test_validator_is_reused_per_schema_path() -> None:
+    assert get_validator(SCHEMA_PATH) is get_validator(SCHEMA_PATH)
+
+
+def test_cached_validator_rejects_invalid_instance() -> None:
+    validate = get_validator(SCHEMA_PATH)
+
+    validate({"facts": ["a", "b", "c"]})
+    with pytest.raises(JsonSchemaValueException):
+        validate({"facts": ["a"]})
@@ -0,0 +1,56 @@
+"""Bake schemas/*.schema.json into tests/_baked_schemas.py as Python literals.
+
+Run ``python tools/bake_schemas.py`` after editing a schema; the test suite
+also re-bakes automatically when a schema is newer than the baked module.
+"""
+from __future__ import annotations
+
+import pprint
+from pathlib import Path
+
+import orjson
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SCHEMAS_DIR = ROOT_DIR / "schemas"
+OUTPUT_PATH = ROOT_DIR / "tests" / "_baked_schemas.py"
+
+
+def _schema_paths() -> list[Path]:
+    return sorted(SCHEMAS_DIR.glob("*.schema.json"))
+
+
+def render() -> str:
+    schemas = {
+        path.name.removesuffix(".schema.json"): orjson.loads(path.read_bytes())
+        for path in _schema_paths()
+    }
+    return (
+        '"""Generated by tools/bake_schemas.py from schemas/*.schema.json; do not edit."""\n\n'
+        f"SCHEMAS = {pprint.pformat(schemas, sort_dicts=False)}\n"
+    )
+
+
+def bake() -> Path:
+    tmp_path = OUTPUT_PATH.with_suffix(".tmp")
+    tmp_path.write_text(render(), encoding="utf-8")
+    tmp_path.replace(OUTPUT_PATH)
+    return OUTPUT_PATH
+
+
+def is_stale() -> bool:
+    if not OUTPUT_PATH.exists():
+        return True
+    baked_at = OUTPUT_PATH.stat().st_mtime_ns
+    return any(path.stat().st_mtime_ns > baked_at for path in _schema_paths())
+
+
+def bake_if_stale() -> bool:
+    """Re-bake when any schema changed since the last bake; return whether it did."""
+    if not is_stale():
+        return False
+    bake()
+    return True
+
+
+if __name__ == "__main__":
+    print(f"Wrote {bake().relative_to(ROOT_DIR)}")